@@ -3,6 +3,7 @@ import numpy as np
 import os
 import sys
 import joblib
+from skill_index import build_skill_index, load_aliases, save_skill_index
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
 from sklearn.ensemble import RandomForestClassifier
@@ -63,6 +64,10 @@ def train_model(csv_path):
         joblib.dump(deg_enc, os.path.join(model_dir, "degree_encoder.pkl"))
         joblib.dump(spec_enc, os.path.join(model_dir, "specialization_encoder.pkl"))
         joblib.dump(mlb, os.path.join(model_dir, "skills_binarizer.pkl"))
+        save_skill_index(
+            build_skill_index(mlb.classes_, load_aliases()),
+            os.path.join(model_dir, "skill_index.json")
+        )
 
         print(f"Model and encoders successfully saved to: {model_dir}")
 
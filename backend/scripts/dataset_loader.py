@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+BASE_COLUMNS = ["degree", "specialization", "cgpa", "internship", "projects", "job_role"]
+WIDE_IGNORED_COLUMNS = {"yearofgraduation"}
+
+
+def is_wide_schema(csv_path):
+    columns = pd.read_csv(csv_path, nrows=0).columns.str.strip().str.lower()
+    return "skills" not in columns
+
+
+def load_source(csv_path):
+    df = pd.read_csv(csv_path)
+    df.columns = df.columns.str.strip().str.lower()
+
+    missing = [c for c in BASE_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"{os.path.basename(csv_path)} is missing columns: {missing}")
+
+    if "skills" in df.columns:
+        skills = df["skills"].apply(
+            lambda x: [s.strip() for s in x.split(",") if s.strip()] if isinstance(x, str) else []
+        )
+    else:
+        # job_role_dataset.csv style: one 0/1 column per skill instead of a skills string
+        skill_cols = [c for c in df.columns if c not in BASE_COLUMNS and c not in WIDE_IGNORED_COLUMNS]
+        flags = df[skill_cols].fillna(0).astype(int).to_numpy().astype(bool)
+        skills = pd.Series([[skill_cols[j] for j in np.flatnonzero(row)] for row in flags], index=df.index)
+
+    internship = df["internship"]
+    if pd.api.types.is_numeric_dtype(internship):
+        # 0/1 layout; Yes/No columns may load as object or str dtype depending on pandas
+        internship = internship.map({1: "Yes", 0: "No"})
+
+    return pd.DataFrame({
+        "degree": df["degree"].astype(str).str.strip(),
+        "specialization": df["specialization"].astype(str).str.strip(),
+        "cgpa": pd.to_numeric(df["cgpa"], errors="coerce"),
+        "internship": internship.fillna("No").astype(str).str.strip().str.capitalize(),
+        "projects": pd.to_numeric(df["projects"], errors="coerce").fillna(0).astype(int),
+        "skills": skills,
+        "job_role": df["job_role"].astype(str).str.strip()
+    }).dropna(subset=["cgpa"])
@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dataset_loader import load_source
+from model_versions import build_input, featurize, list_versions, load_version, top_k_roles
+
+SINGLE_ROW_SAMPLES = 50
+
+_shared = None
+_truth = None
+
+
+def _init_worker(shared, truth):
+    global _shared, _truth
+    warnings.simplefilter("ignore")
+    _shared = shared
+    _truth = truth
+
+
+def score_version(path):
+    version = load_version(path)
+    model = version["model"]
+    # The pool already runs one version per core
+    model.n_jobs = 1
+
+    probs = model.predict_proba(build_input(version, _shared))
+
+    top_roles, _ = top_k_roles(version, probs, k=3)
+    hit = top_roles[:, 0] == _truth
+    top3_hit = (top_roles == _truth[:, None]).any(axis=1)
+
+    recall = {
+        role: round(float(hit[_truth == role].mean()), 4)
+        for role in np.unique(_truth)
+    }
+
+    return {
+        "version": version["name"],
+        "accuracy": round(float(hit.mean()), 4),
+        "top3_hit_rate": round(float(top3_hit.mean()), 4),
+        "model_size_mb": round(version["size_bytes"] / 1024 / 1024, 2),
+        "n_features": len(version["features"]),
+        "per_role_recall": recall
+    }
+
+
+def time_version(path, shared):
+    """Latency for one version, run after the pool so no other version competes for the cores."""
+    version = load_version(path)
+    model = version["model"]
+    model.n_jobs = 1
+    X = build_input(version, shared)
+    # Warm-up so the first version does not also pay one-off setup costs
+    model.predict_proba(X.iloc[[0]])
+
+    start = time.perf_counter()
+    model.predict_proba(X)
+    batch_seconds = time.perf_counter() - start
+
+    single_ms = []
+    for i in range(min(SINGLE_ROW_SAMPLES, len(X))):
+        start = time.perf_counter()
+        model.predict_proba(X.iloc[[i]])
+        single_ms.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "batch_ms_per_row": round(batch_seconds * 1000 / len(X), 4),
+        "single_row_p50_ms": round(float(np.median(single_ms)), 3)
+    }
+
+
+def evaluate(csv_path, version_paths, workers=None):
+    df = load_source(csv_path)
+    truth = df["job_role"].to_numpy(dtype=object)
+
+    shared = featurize(df)
+    print(f"Featurized {len(df)} rows x {len(shared['skill_vocab'])} skill tokens from "
+          f"{os.path.basename(csv_path)}", file=sys.stderr)
+
+    workers = workers or min(len(version_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(shared, truth)) as pool:
+        results = list(pool.map(score_version, version_paths))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for path, result in zip(version_paths, results):
+            result.update(time_version(path, shared))
+    return results
+
+
+def print_report(results):
+    summary = pd.DataFrame([
+        {k: v for k, v in r.items() if k != "per_role_recall"} for r in results
+    ]).set_index("version")
+    recall = pd.DataFrame({r["version"]: r["per_role_recall"] for r in results})
+
+    print("\n--- Version Comparison ---")
+    print(summary.to_string())
+    print("\n--- Per-Role Recall ---")
+    print(recall.to_string())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Score archived model versions side by side on one held-out dataset."
+    )
+    parser.add_argument("dataset", help="held-out CSV in the training schema")
+    parser.add_argument("versions", nargs="*",
+                        help="model folders to compare (default: every models_archive/model_v_* plus model/)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of tables")
+    args = parser.parse_args()
+
+    try:
+        version_paths = args.versions or list_versions()
+        if not version_paths:
+            print("Error: no model versions found")
+            sys.exit(1)
+
+        results = evaluate(args.dataset, version_paths, workers=args.workers)
+
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_report(results)
+
+    except Exception as e:
+        print(f"An error occurred during evaluation: {str(e)}")
+        sys.exit(1)
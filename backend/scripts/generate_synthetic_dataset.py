@@ -0,0 +1,212 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from dataset_loader import is_wide_schema, load_source
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+dataset_dir = os.path.join(script_dir, "../dataset")
+
+OUTPUT_COLUMNS = ["degree", "specialization", "cgpa", "internship", "projects", "skills", "job_role"]
+# Every block of this many rows draws from its own child of the seed, so the
+# output for a given --seed does not depend on --chunk-size
+RNG_BLOCK_SIZE = 50_000
+
+
+def fit_profiles(df):
+    """Learn per-role marginals and the observed skill sets (which carry co-occurrence)."""
+    vocab = sorted({s for skills in df["skills"] for s in skills})
+    vocab_idx = {s: i for i, s in enumerate(vocab)}
+
+    skill_matrix = np.zeros((len(df), len(vocab)), dtype=bool)
+    for row, skills in enumerate(df["skills"]):
+        skill_matrix[row, [vocab_idx[s] for s in skills]] = True
+
+    role_counts = df["job_role"].value_counts()
+    roles = role_counts.index.to_numpy()
+    cgpa_min, cgpa_max = float(df["cgpa"].min()), float(df["cgpa"].max())
+
+    profiles = []
+    for role in roles:
+        mask = (df["job_role"] == role).to_numpy()
+        part = df[mask]
+        degree = part["degree"].value_counts(normalize=True)
+        spec = part["specialization"].value_counts(normalize=True)
+        projects = part["projects"].value_counts(normalize=True)
+        profiles.append({
+            "degree_values": degree.index.to_numpy(dtype=object),
+            "degree_p": degree.to_numpy(),
+            "spec_values": spec.index.to_numpy(dtype=object),
+            "spec_p": spec.to_numpy(),
+            "projects_values": projects.index.to_numpy(dtype=np.int64),
+            "projects_p": projects.to_numpy(),
+            "cgpa_mean": float(part["cgpa"].mean()),
+            "cgpa_std": float(np.nan_to_num(part["cgpa"].std())),
+            "internship_rate": float((part["internship"] == "Yes").mean()),
+            "skill_sets": skill_matrix[mask],
+            "skill_p": skill_matrix[mask].mean(axis=0)
+        })
+
+    return {
+        "roles": roles,
+        "role_p": (role_counts / role_counts.sum()).to_numpy(),
+        "vocab": np.array(vocab, dtype=object),
+        "cgpa_range": (cgpa_min, cgpa_max),
+        "profiles": profiles
+    }
+
+
+def join_skill_rows(skill_rows, vocab, unseen_tokens):
+    """Turn a boolean skill matrix into comma-joined strings, formatting each distinct set only once."""
+    packed = np.packbits(skill_rows, axis=1)
+    unique_rows, inverse = np.unique(packed, axis=0, return_inverse=True)
+    unpacked = np.unpackbits(unique_rows, axis=1, count=len(vocab)).astype(bool)
+    joined = np.array([", ".join(vocab[row]) for row in unpacked], dtype=object)
+    skills = joined[inverse.ravel()]
+
+    has_unseen = unseen_tokens != ""
+    if has_unseen.any():
+        prefix = np.where(skills[has_unseen] == "", "", skills[has_unseen] + ", ")
+        skills[has_unseen] = prefix + unseen_tokens[has_unseen]
+    return skills
+
+
+def unseen_values(rng, n, rate, label, pool_size):
+    values = np.full(n, "", dtype=object)
+    mask = rng.random(n) < rate
+    if mask.any():
+        ids = rng.integers(1, pool_size + 1, size=int(mask.sum()))
+        values[mask] = np.char.add(f"Unseen {label} ", ids.astype(str)).astype(object)
+    return values
+
+
+def generate_chunk(fitted, n, rng, unseen_rate=0.0, skill_noise=0.05, unseen_pool=50):
+    profiles = fitted["profiles"]
+    vocab = fitted["vocab"]
+    cgpa_min, cgpa_max = fitted["cgpa_range"]
+
+    role_idx = rng.choice(len(profiles), size=n, p=fitted["role_p"])
+
+    degree = np.empty(n, dtype=object)
+    spec = np.empty(n, dtype=object)
+    cgpa = np.empty(n, dtype=np.float64)
+    internship = np.empty(n, dtype=bool)
+    projects = np.empty(n, dtype=np.int64)
+    skill_rows = np.zeros((n, len(vocab)), dtype=bool)
+
+    for r, prof in enumerate(profiles):
+        rows = np.flatnonzero(role_idx == r)
+        k = len(rows)
+        if k == 0:
+            continue
+
+        degree[rows] = rng.choice(prof["degree_values"], size=k, p=prof["degree_p"])
+        spec[rows] = rng.choice(prof["spec_values"], size=k, p=prof["spec_p"])
+        cgpa[rows] = rng.normal(prof["cgpa_mean"], prof["cgpa_std"], size=k)
+        internship[rows] = rng.random(k) < prof["internship_rate"]
+        projects[rows] = rng.choice(prof["projects_values"], size=k, p=prof["projects_p"])
+
+        # Resample whole observed skill sets so co-occurrence is preserved, then
+        # drop/add a few skills following the role's marginals.
+        templates = prof["skill_sets"][rng.integers(0, len(prof["skill_sets"]), size=k)]
+        noise = rng.random(templates.shape) < skill_noise
+        added = rng.random(templates.shape) < prof["skill_p"]
+        skill_rows[rows] = np.where(noise, added, templates)
+
+    new_degree = unseen_values(rng, n, unseen_rate, "Degree", unseen_pool)
+    new_spec = unseen_values(rng, n, unseen_rate, "Specialization", unseen_pool)
+    new_skill = unseen_values(rng, n, unseen_rate, "Skill", unseen_pool)
+    degree = np.where(new_degree != "", new_degree, degree)
+    spec = np.where(new_spec != "", new_spec, spec)
+
+    return pd.DataFrame({
+        "degree": degree,
+        "specialization": spec,
+        "cgpa": np.round(np.clip(cgpa, cgpa_min, cgpa_max), 2),
+        "internship": np.where(internship, "Yes", "No"),
+        "projects": projects,
+        "skills": join_skill_rows(skill_rows, vocab, new_skill),
+        "job_role": fitted["roles"][role_idx]
+    }, columns=OUTPUT_COLUMNS)
+
+
+def generate_block(fitted, block, n_rows, seed, unseen_rate, skill_noise):
+    n = min(RNG_BLOCK_SIZE, n_rows - block * RNG_BLOCK_SIZE)
+    # Same stream as np.random.SeedSequence(seed).spawn(...)[block]
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+    return generate_chunk(fitted, n, rng, unseen_rate=unseen_rate, skill_noise=skill_noise)
+
+
+def generate_dataset(source_paths, output_path, n_rows, chunk_size=250_000,
+                     unseen_rate=0.0, skill_noise=0.05, seed=42):
+    # The wide layout's skills are lowercase column names ("python", "uiux"); mixed
+    # with skills strings they would end up as separate entries of one vocabulary
+    if len({is_wide_schema(p) for p in source_paths}) > 1:
+        raise ValueError("cannot mix one-column-per-skill sources with skills-string sources")
+
+    df = pd.concat([load_source(p) for p in source_paths], ignore_index=True)
+    fitted = fit_profiles(df)
+    print(f"Fitted {len(fitted['roles'])} roles and {len(fitted['vocab'])} skills from {len(df)} rows")
+
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(out_dir, exist_ok=True)
+
+    blocks_per_chunk = max(1, -(-chunk_size // RNG_BLOCK_SIZE))
+    n_blocks = -(-n_rows // RNG_BLOCK_SIZE)
+    start = time.perf_counter()
+    written = 0
+
+    for first in range(0, n_blocks, blocks_per_chunk):
+        chunk = pd.concat([
+            generate_block(fitted, b, n_rows, seed, unseen_rate, skill_noise)
+            for b in range(first, min(first + blocks_per_chunk, n_blocks))
+        ], ignore_index=True)
+        chunk.to_csv(output_path, mode="w" if written == 0 else "a", header=written == 0, index=False)
+        written += len(chunk)
+        elapsed = time.perf_counter() - start
+        print(f"Wrote {written}/{n_rows} rows ({written / max(elapsed, 1e-9):,.0f} rows/s)")
+        sys.stdout.flush()
+
+    print(f"Synthetic dataset saved to: {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate a large synthetic job role dataset from the existing CSVs."
+    )
+    parser.add_argument("rows", type=int, help="number of rows to generate")
+    parser.add_argument("output", help="path of the CSV to write")
+    parser.add_argument("--source", action="append",
+                        help="CSV to learn from (repeatable, default: dataset/synthetic_it_dataset.csv)")
+    parser.add_argument("--chunk-size", type=int, default=250_000,
+                        help=f"rows written per chunk, rounded up to a multiple of {RNG_BLOCK_SIZE:,}")
+    parser.add_argument("--unseen-rate", type=float, default=0.0,
+                        help="per-column rate of unseen degrees, specializations and skills")
+    parser.add_argument("--skill-noise", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42,
+                        help="the same seed and row count give the same dataset for any --chunk-size")
+    args = parser.parse_args()
+
+    if args.rows <= 0 or args.chunk_size <= 0:
+        parser.error("rows and --chunk-size must be positive")
+    if not 0.0 <= args.unseen_rate <= 1.0:
+        parser.error("--unseen-rate must be between 0 and 1")
+    if not 0.0 <= args.skill_noise <= 1.0:
+        parser.error("--skill-noise must be between 0 and 1")
+
+    sources = args.source or [os.path.join(dataset_dir, "synthetic_it_dataset.csv")]
+    try:
+        generate_dataset(
+            sources, args.output, args.rows,
+            chunk_size=args.chunk_size,
+            unseen_rate=args.unseen_rate,
+            skill_noise=args.skill_noise,
+            seed=args.seed
+        )
+    except Exception as e:
+        print(f"An error occurred during generation: {str(e)}")
+        sys.exit(1)
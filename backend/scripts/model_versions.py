@@ -0,0 +1,127 @@
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from skill_index import SkillResolver, build_skill_index, load_aliases, load_skill_index
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+model_dir = os.path.join(script_dir, "../model")
+archive_dir = os.path.join(script_dir, "../models_archive")
+
+BASE_FEATURES = ["degree", "specialization", "cgpa", "internship", "projects"]
+
+
+def list_versions():
+    """Archived model_v_* folders, oldest first, followed by the active model."""
+    versions = []
+    if os.path.isdir(archive_dir):
+        for name in sorted(os.listdir(archive_dir)):
+            path = os.path.join(archive_dir, name)
+            if name.startswith("model_v_") and os.path.isdir(path):
+                versions.append(path)
+    if os.path.isdir(model_dir):
+        versions.append(model_dir)
+    return versions
+
+
+def version_name(path):
+    path = os.path.abspath(path)
+    if path == os.path.abspath(model_dir):
+        return "active"
+    return os.path.basename(path.rstrip(os.sep))
+
+
+def version_resolver(path, skills_mlb):
+    # Same lookup predict_jobrole.py uses for that version: its saved index, or one
+    # built from its binarizer for models trained before the index existed
+    index_path = os.path.join(path, "skill_index.json")
+    if os.path.exists(index_path):
+        return SkillResolver(load_skill_index(index_path))
+    return SkillResolver(build_skill_index(skills_mlb.classes_, load_aliases()))
+
+
+def load_version(path):
+    model = joblib.load(os.path.join(path, "random_forest_model.pkl"))
+    size = sum(
+        os.path.getsize(os.path.join(path, f))
+        for f in os.listdir(path) if f.endswith(".pkl")
+    )
+    skills_mlb = joblib.load(os.path.join(path, "skills_binarizer.pkl"))
+    return {
+        "name": version_name(path),
+        "path": path,
+        "model": model,
+        "degree_enc": joblib.load(os.path.join(path, "degree_encoder.pkl")),
+        "spec_enc": joblib.load(os.path.join(path, "specialization_encoder.pkl")),
+        "skills_mlb": skills_mlb,
+        "skill_resolver": version_resolver(path, skills_mlb),
+        "job_enc": joblib.load(os.path.join(path, "jobrole_label_encoder.pkl")),
+        "features": list(model.feature_names_in_),
+        "size_bytes": size
+    }
+
+
+def featurize(df, skill_vocab=None):
+    """Version-independent features: raw categoricals plus a matrix of the skill tokens.
+
+    The tokens are kept as written (default: every token in df); each version maps
+    them through its own skill resolver in build_input, so the dataset is parsed once.
+    """
+    if skill_vocab is None:
+        skill_vocab = sorted({s for row_skills in df["skills"] for s in row_skills})
+    vocab_idx = {s: i for i, s in enumerate(skill_vocab)}
+    skills = np.zeros((len(df), len(skill_vocab)), dtype=np.uint8)
+    for row, row_skills in enumerate(df["skills"]):
+        cols = [vocab_idx[s] for s in row_skills if s in vocab_idx]
+        skills[row, cols] = 1
+
+    return {
+        "degree": df["degree"].to_numpy(dtype=object),
+        "specialization": df["specialization"].to_numpy(dtype=object),
+        "cgpa": df["cgpa"].to_numpy(dtype=np.float64),
+        "internship": (df["internship"] == "Yes").to_numpy().astype(np.int64),
+        "projects": df["projects"].to_numpy(dtype=np.int64),
+        "skill_vocab": list(skill_vocab),
+        "skills": skills
+    }
+
+
+def safe_encode_column(encoder, values):
+    # Same fallback as predict_jobrole.safe_label_encode: unknown values map to 0
+    mapping = {cls: i for i, cls in enumerate(encoder.classes_)}
+    return pd.Series(values).map(mapping).fillna(0).astype(np.int64).to_numpy()
+
+
+def build_input(version, shared):
+    """Cut the version's feature matrix, in its training column order, out of the shared features."""
+    n = len(shared["cgpa"])
+    columns = {
+        "degree": safe_encode_column(version["degree_enc"], shared["degree"]),
+        "specialization": safe_encode_column(version["spec_enc"], shared["specialization"]),
+        "cgpa": shared["cgpa"],
+        "internship": shared["internship"],
+        "projects": shared["projects"]
+    }
+    # Resolve each distinct token once; a skill column is set when any token
+    # resolving to it is present ("Power BI" and "PowerBI" both feed PowerBI)
+    token_cols = {}
+    for i, token in enumerate(shared["skill_vocab"]):
+        skill = version["skill_resolver"].resolve_token(token)
+        if skill is not None:
+            token_cols.setdefault(skill, []).append(i)
+
+    X = np.zeros((n, len(version["features"])), dtype=np.float64)
+    for j, feature in enumerate(version["features"]):
+        if feature in columns:
+            X[:, j] = columns[feature]
+        elif feature in token_cols:
+            X[:, j] = shared["skills"][:, token_cols[feature]].max(axis=1)
+    return pd.DataFrame(X, columns=version["features"])
+
+
+def top_k_roles(version, probs, k=3):
+    top_idx = np.argsort(probs, axis=1)[:, ::-1][:, :k]
+    labels = version["job_enc"].inverse_transform(version["model"].classes_)
+    return labels[top_idx], np.take_along_axis(probs, top_idx, axis=1)
@@ -4,6 +4,11 @@ import joblib
 import pandas as pd
 import numpy as np
 import os
+import random
+import subprocess
+
+from shadow_score import acquire_shadow_slot, env_number, release_shadow_slot
+from skill_index import SkillResolver, build_skill_index, load_aliases, load_skill_index
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -12,6 +17,7 @@ degree_enc_path = os.path.join(script_dir, "../model/degree_encoder.pkl")
 spec_enc_path = os.path.join(script_dir, "../model/specialization_encoder.pkl")
 skills_mlb_path = os.path.join(script_dir, "../model/skills_binarizer.pkl")
 job_enc_path = os.path.join(script_dir, "../model/jobrole_label_encoder.pkl")
+skill_index_path = os.path.join(script_dir, "../model/skill_index.json")
 
 model = joblib.load(model_path)
 degree_enc = joblib.load(degree_enc_path)
@@ -19,20 +25,21 @@ spec_enc = joblib.load(spec_enc_path)
 skills_mlb = joblib.load(skills_mlb_path)
 job_enc = joblib.load(job_enc_path)
 
-EXPECTED_FEATURES = list(model.feature_names_in_)
+# Models trained before the skill index existed get one built from their binarizer
+if os.path.exists(skill_index_path):
+    skill_index = load_skill_index(skill_index_path)
+else:
+    skill_index = build_skill_index(skills_mlb.classes_, load_aliases())
+skill_resolver = SkillResolver(skill_index)
 
-SKILL_ALIASES = {
-    "ml": "Machine Learning",
-    "ai": "Artificial Intelligence",
-    "py": "Python",
-    "js": "JavaScript",
-    "db": "SQL",
-    "node": "Node.js",
-    "cyber": "Cyber Security"
-}
+EXPECTED_FEATURES = list(model.feature_names_in_)
 
-def normalize_skills(skills):
-    return [SKILL_ALIASES.get(s.lower().strip(), s) for s in skills]
+# Shadow mode: score a candidate model on a sample of live requests, off the hot path.
+# Keep SHADOW_SAMPLE_RATE small; at most SHADOW_MAX_WORKERS shadow scorers run at once
+# and sampled requests beyond that are skipped.
+SHADOW_MODEL_DIR = os.environ.get("SHADOW_MODEL_DIR", "")
+SHADOW_SAMPLE_RATE = env_number("SHADOW_SAMPLE_RATE", 0.0, low=0.0, high=1.0)
+shadow_script_path = os.path.join(script_dir, "shadow_score.py")
 
 def safe_label_encode(encoder, value):
     if value in encoder.classes_:
@@ -40,13 +47,41 @@ def safe_label_encode(encoder, value):
     return 0  
 
 
+def launch_shadow(features, result):
+    if not SHADOW_MODEL_DIR or random.random() >= SHADOW_SAMPLE_RATE:
+        return
+    if not os.path.isdir(SHADOW_MODEL_DIR):
+        return
+
+    slot = acquire_shadow_slot()
+    if slot is None:
+        return
+
+    payload = json.dumps({"input": features, "live": result})
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    try:
+        # Detached with no shared stdio, so the caller never waits on the candidate model
+        subprocess.Popen(
+            [sys.executable, shadow_script_path, SHADOW_MODEL_DIR, payload, slot],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            **kwargs
+        )
+    except OSError:
+        release_shadow_slot(slot)
+
+
 def predict_job_role(degree, specialization, cgpa, internship, projects, skills):
 
     deg_val = safe_label_encode(degree_enc, degree)
     spec_val = safe_label_encode(spec_enc, specialization)
     internship_val = 1 if internship.lower() == "yes" else 0
 
-    skills = normalize_skills(skills)
+    skills, unresolved_skills = skill_resolver.resolve(skills)
     skill_vector = skills_mlb.transform([skills])
     skill_df = pd.DataFrame(skill_vector, columns=skills_mlb.classes_)
 
@@ -78,6 +113,7 @@ def predict_job_role(degree, specialization, cgpa, internship, projects, skills)
         "predicted_job_role": top_matches[0]["role"],
         "match_percentage": top_matches[0]["confidence"],
         "top_3_matches": top_matches,
+        "unresolved_skills": unresolved_skills,
         "status": "success"
     }
 
@@ -100,6 +136,15 @@ if __name__ == "__main__":
 
         print(json.dumps(result))
         sys.stdout.flush()
+
+        launch_shadow({
+            "degree": data.get("degree", ""),
+            "specialization": data.get("specialization", ""),
+            "cgpa": float(data.get("cgpa", 0)),
+            "internship": data.get("internship", "No"),
+            "projects": int(data.get("projects", 0)),
+            "skills": skills
+        }, result)
         os._exit(0)  
 
     except Exception as e:
@@ -0,0 +1,182 @@
+import json
+import os
+import sys
+import time
+import warnings
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from model_versions import build_input, featurize, load_version, top_k_roles
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def env_number(name, default, cast=float, low=None, high=None):
+    # Shadow settings are optional, so a bad value falls back instead of failing predictions
+    try:
+        value = cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        value = default
+    if low is not None:
+        value = max(low, value)
+    if high is not None:
+        value = min(high, value)
+    return value
+
+
+SHADOW_LOG = os.environ.get(
+    "SHADOW_LOG", os.path.join(script_dir, "../logs/shadow_predictions.jsonl")
+)
+# Each shadow worker is a separate interpreter that reloads the candidate
+# (around a second of CPU), so keep SHADOW_SAMPLE_RATE small (e.g. 0.01-0.05)
+SHADOW_MAX_WORKERS = env_number("SHADOW_MAX_WORKERS", 2, cast=int, low=0)
+SHADOW_LOG_MAX_BYTES = env_number("SHADOW_LOG_MAX_BYTES", 10 * 1024 * 1024, cast=int, low=1024)
+# Slot files older than this belong to a worker that died without cleaning up
+SHADOW_SLOT_TIMEOUT = 120
+slot_dir = os.path.join(os.path.dirname(os.path.abspath(SHADOW_LOG)), "shadow_slots")
+
+
+def acquire_shadow_slot():
+    """Claim one of SHADOW_MAX_WORKERS slot files, or return None when all are busy."""
+    try:
+        os.makedirs(slot_dir, exist_ok=True)
+    except OSError:
+        return None
+
+    for i in range(SHADOW_MAX_WORKERS):
+        path = os.path.join(slot_dir, f"slot_{i}.lock")
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return path
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) < SHADOW_SLOT_TIMEOUT:
+                        break
+                    os.remove(path)
+                except OSError:
+                    pass
+            except OSError:
+                return None
+    return None
+
+
+def release_shadow_slot(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def rotate_log(log_path=SHADOW_LOG):
+    # One rotated file is kept, so the log never grows past about twice the cap
+    try:
+        if os.path.getsize(log_path) >= SHADOW_LOG_MAX_BYTES:
+            os.replace(log_path, log_path + ".1")
+    except OSError:
+        pass
+
+
+def shadow_score(candidate_dir, features, live_result):
+    """Score one request with the candidate model and append the comparison to SHADOW_LOG."""
+    start = time.perf_counter()
+    version = load_version(candidate_dir)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    df = pd.DataFrame([{
+        "degree": features.get("degree", ""),
+        "specialization": features.get("specialization", ""),
+        "cgpa": float(features.get("cgpa", 0)),
+        "internship": "Yes" if str(features.get("internship", "No")).lower() == "yes" else "No",
+        "projects": int(features.get("projects", 0)),
+        # Raw skills: build_input resolves them with the candidate's own index,
+        # not the live model's
+        "skills": [str(s).strip() for s in features.get("skills", []) if str(s).strip()]
+    }])
+
+    start = time.perf_counter()
+    X = build_input(version, featurize(df))
+    probs = version["model"].predict_proba(X)
+    roles, confidences = top_k_roles(version, probs, k=3)
+    score_ms = (time.perf_counter() - start) * 1000
+
+    shadow_matches = [
+        {"role": role, "confidence": round(float(c) * 100, 2)}
+        for role, c in zip(roles[0], confidences[0])
+    ]
+    live_matches = live_result.get("top_3_matches", [])
+
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "candidate": version["name"],
+        "input": features,
+        "live_top_3": live_matches,
+        "shadow_top_3": shadow_matches,
+        "top1_agree": bool(live_matches) and live_matches[0]["role"] == shadow_matches[0]["role"],
+        "load_ms": round(load_ms, 2),
+        "score_ms": round(score_ms, 2)
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(SHADOW_LOG)), exist_ok=True)
+    rotate_log()
+    with open(SHADOW_LOG, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    return record
+
+
+def shadow_report(log_path=SHADOW_LOG):
+    stats = defaultdict(lambda: {"requests": 0, "top1_agree": 0, "top3_overlap": 0.0, "score_ms": 0.0})
+
+    with open(log_path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            s = stats[rec["candidate"]]
+            live = {m["role"] for m in rec["live_top_3"]}
+            shadow = {m["role"] for m in rec["shadow_top_3"]}
+            s["requests"] += 1
+            s["top1_agree"] += int(rec["top1_agree"])
+            s["top3_overlap"] += len(live & shadow) / max(len(live), 1)
+            s["score_ms"] += rec["score_ms"]
+
+    return {
+        name: {
+            "requests": s["requests"],
+            "top1_agreement": round(s["top1_agree"] / s["requests"], 4),
+            "mean_top3_overlap": round(s["top3_overlap"] / s["requests"], 4),
+            "mean_score_ms": round(s["score_ms"] / s["requests"], 2)
+        }
+        for name, s in stats.items()
+    }
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--report":
+        log_path = sys.argv[2] if len(sys.argv) > 2 else SHADOW_LOG
+        if not os.path.exists(log_path):
+            print(f"Error: shadow log not found at {log_path}")
+            sys.exit(1)
+        print(json.dumps(shadow_report(log_path), indent=2))
+
+    elif len(sys.argv) > 3:
+        # Launched in the background by predict_jobrole.py, holding the slot in argv[3];
+        # failures must stay silent
+        try:
+            payload = json.loads(sys.argv[2])
+            shadow_score(sys.argv[1], payload["input"], payload["live"])
+        except Exception:
+            sys.exit(1)
+        finally:
+            release_shadow_slot(sys.argv[3])
+
+    else:
+        print("Usage: python shadow_score.py <candidate_model_dir> <payload_json> <slot_file>")
+        print("       python shadow_score.py --report [shadow_log]")
+        sys.exit(1)
@@ -0,0 +1,184 @@
+import json
+import os
+import re
+from collections import Counter
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+aliases_path = os.path.join(script_dir, "skill_aliases.json")
+
+GRAM_SIZE = 3
+MIN_FUZZY_LENGTH = 4
+# Up to this length a general edit turns ordinary words into skills ("Rest" -> "Rust",
+# "String" -> "Spring"), so only typing slips are accepted: see is_typing_slip
+STRICT_LENGTH = 8
+# A dropped letter is only accepted from this length ("Pythn", "Dockr")
+MIN_DROPPED_LETTER_LENGTH = 5
+MAX_CANDIDATES = 8
+MAX_CACHE_SIZE = 100_000
+
+
+def load_aliases(path=aliases_path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def normalize_key(skill):
+    # "Machine-Learning", "machine learning" and "MachineLearning" share one key;
+    # + and # are kept so C++ and C# stay distinct from C
+    return re.sub(r"[^a-z0-9+#]", "", str(skill).casefold())
+
+
+def char_grams(key):
+    padded = f"^{key}$"
+    return {padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1)}
+
+
+def is_transposition(a, b):
+    if len(a) != len(b):
+        return False
+    diff = [i for i in range(len(a)) if a[i] != b[i]]
+    return (len(diff) == 2 and diff[1] == diff[0] + 1
+            and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]])
+
+
+def is_typing_slip(key, skill):
+    """Two adjacent letters swapped, one letter dropped (not the first), or one letter doubled.
+
+    Substitutions are never accepted here: "String" is not a typo of "Spring".
+    """
+    if is_transposition(key, skill):
+        return True
+    if len(key) == len(skill) - 1:
+        return (len(key) >= MIN_DROPPED_LETTER_LENGTH and key[0] == skill[0]
+                and any(skill[:i] + skill[i + 1:] == key for i in range(1, len(skill))))
+    if len(key) == len(skill) + 1:
+        # "Pythonn", but not "Scalar" -> "Scala": the extra letter must repeat its neighbour
+        return any(key[i] == key[i - 1] and key[:i] + key[i + 1:] == skill
+                   for i in range(1, len(key)))
+    return False
+
+
+def bounded_edit_distance(a, b, limit):
+    """Edit distance counting adjacent transpositions ("pyhton") as one edit,
+    or limit + 1 as soon as it is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    before = None
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        curr = [i] + [0] * len(b)
+        for j, cb in enumerate(b, start=1):
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (ca != cb))
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                curr[j] = min(curr[j], before[j - 2] + 1)
+        if min(curr) > limit:
+            return limit + 1
+        before, prev = prev, curr
+    return prev[-1]
+
+
+def build_skill_index(vocab, aliases=None):
+    """Lookup tables mapping free-text skills onto the binarizer vocabulary.
+
+    Plain lists and dicts only, so the index is saved as JSON next to the model.
+    """
+    vocab = [str(s) for s in vocab]
+    exact = {}
+    for skill in vocab:
+        exact.setdefault(normalize_key(skill), skill)
+
+    for alias, target in (aliases or {}).items():
+        # Alias targets are matched loosely too, so "Power BI" still finds "PowerBI"
+        canonical = target if target in vocab else exact.get(normalize_key(target))
+        if canonical is not None:
+            exact.setdefault(normalize_key(alias), canonical)
+
+    keys = sorted(exact)
+    grams = {}
+    for i, key in enumerate(keys):
+        for gram in char_grams(key):
+            grams.setdefault(gram, []).append(i)
+
+    return {"vocab": vocab, "exact": exact, "keys": keys, "grams": grams}
+
+
+def save_skill_index(index, path):
+    with open(path, "w") as f:
+        json.dump(index, f)
+
+
+def load_skill_index(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class SkillResolver:
+    """Resolves free-text skills against a skill index, memoizing every token it has seen."""
+
+    def __init__(self, index):
+        self.index = index
+        self.vocab = set(index["vocab"])
+        self.cache = {}
+
+    def resolve_token(self, token):
+        token = str(token).strip()
+        if token in self.vocab:
+            return token
+        if token in self.cache:
+            return self.cache[token]
+
+        if len(self.cache) >= MAX_CACHE_SIZE:
+            self.cache.clear()
+        match = self._lookup(normalize_key(token))
+        self.cache[token] = match
+        return match
+
+    def _lookup(self, key):
+        if not key:
+            return None
+        if key in self.index["exact"]:
+            return self.index["exact"][key]
+        if len(key) < MIN_FUZZY_LENGTH:
+            return None
+
+        # Only the few keys sharing the most character trigrams are edit-distance
+        # checked, so the cost per token does not grow with the vocabulary
+        shared = Counter()
+        for gram in char_grams(key):
+            shared.update(self.index["grams"].get(gram, ()))
+
+        limit = 1 if len(key) <= STRICT_LENGTH else 2
+        best, best_dist = set(), limit + 1
+        for i, _ in shared.most_common(MAX_CANDIDATES):
+            candidate = self.index["keys"][i]
+            if len(key) <= STRICT_LENGTH:
+                dist = 1 if is_typing_slip(key, candidate) else limit + 1
+            else:
+                dist = bounded_edit_distance(key, candidate, limit)
+            if dist < best_dist:
+                best, best_dist = {self.index["exact"][candidate]}, dist
+            elif dist == best_dist and dist <= limit:
+                best.add(self.index["exact"][candidate])
+
+        # Two different skills equally close is a guess, not a match
+        return best.pop() if len(best) == 1 else None
+
+    def resolve(self, skills):
+        """Return (resolved skills without duplicates, tokens that matched nothing)."""
+        resolved, unresolved = [], []
+        for skill in skills:
+            if not str(skill).strip():
+                continue
+            match = self.resolve_token(skill)
+            if match is None:
+                unresolved.append(skill)
+            elif match not in resolved:
+                resolved.append(match)
+        return resolved, unresolved
+
+    def resolve_batch(self, skill_lists):
+        results = [self.resolve(skills) for skills in skill_lists]
+        return [r[0] for r in results], [r[1] for r in results]
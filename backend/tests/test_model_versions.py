@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../scripts"))
+
+from model_versions import build_input, featurize
+from skill_index import SkillResolver, build_skill_index
+
+
+def make_version(skills):
+    return {
+        "degree_enc": LabelEncoder().fit(["BCA", "MCA"]),
+        "spec_enc": LabelEncoder().fit(["AI", "Data Science"]),
+        "skill_resolver": SkillResolver(build_skill_index(skills, {"k8s": "Kubernetes"})),
+        "features": ["degree", "specialization", "cgpa", "internship", "projects"] + skills
+    }
+
+
+def test_build_input_resolves_tokens_per_version():
+    df = pd.DataFrame([
+        {"degree": "MCA", "specialization": "AI", "cgpa": 8.0, "internship": "Yes",
+         "projects": 2, "skills": ["Power BI", "pyhton"]},
+        {"degree": "PhD", "specialization": "AI", "cgpa": 7.0, "internship": "No",
+         "projects": 1, "skills": ["k8s", "Excel"]},
+    ])
+    shared = featurize(df)
+
+    X = build_input(make_version(["Kubernetes", "PowerBI", "Python"]), shared)
+    assert X[["PowerBI", "Python", "Kubernetes"]].values.tolist() == [[1, 1, 0], [0, 0, 1]]
+    assert X["internship"].tolist() == [1, 0]
+    # Unknown degree falls back to 0 like predict_jobrole.safe_label_encode
+    assert X["degree"].tolist() == [1, 0]
+
+    # Another version only sees the skills in its own vocabulary
+    X = build_input(make_version(["Excel", "Python"]), shared)
+    assert X[["Excel", "Python"]].values.tolist() == [[0, 1], [1, 0]]
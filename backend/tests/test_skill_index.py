@@ -0,0 +1,85 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../scripts"))
+
+from skill_index import SkillResolver, bounded_edit_distance, build_skill_index
+
+VOCAB = [
+    "Bash", "Cisco", "Docker", "Flutter", "Hive", "Java", "JavaScript", "Kubernetes",
+    "Machine Learning", "Node.js", "Python", "React", "Rust", "Scala", "Spring", "Xcode"
+]
+ALIASES = {"k8s": "Kubernetes", "reactjs": "React", "ml": "Machine Learning"}
+
+
+def make_resolver(vocab=VOCAB):
+    return SkillResolver(build_skill_index(vocab, ALIASES))
+
+
+def test_edit_distance_counts_adjacent_transposition_once():
+    assert bounded_edit_distance("pyhton", "python", 2) == 1
+    assert bounded_edit_distance("ab", "ba", 1) == 1
+
+
+def test_edit_distance_plain_edits():
+    assert bounded_edit_distance("python", "python", 1) == 0
+    assert bounded_edit_distance("kitten", "sitting", 5) == 3
+    assert bounded_edit_distance("docker", "dockr", 1) == 1
+
+
+def test_edit_distance_stops_past_limit():
+    assert bounded_edit_distance("kitten", "sitting", 2) == 3
+    assert bounded_edit_distance("java", "javascript", 2) == 3
+    assert bounded_edit_distance("abcdef", "uvwxyz", 1) == 2
+
+
+def test_exact_casefold_punctuation_and_aliases():
+    resolver = make_resolver()
+    resolved, unresolved = resolver.resolve(
+        ["Python", "python ", "machine-learning", "NodeJS", "k8s", "ReactJS", "ml"]
+    )
+    assert resolved == ["Python", "Machine Learning", "Node.js", "Kubernetes", "React"]
+    assert unresolved == []
+
+
+def test_typos_resolve():
+    resolver = make_resolver()
+    assert resolver.resolve_token("pyhton") == "Python"
+    assert resolver.resolve_token("Javscript") == "JavaScript"
+    assert resolver.resolve_token("Kubernets") == "Kubernetes"
+    assert resolver.resolve_token("Jaav") == "Java"
+    assert resolver.resolve_token("Pythn") == "Python"
+    assert resolver.resolve_token("Dockr") == "Docker"
+    assert resolver.resolve_token("Pythonn") == "Python"
+
+
+def test_ordinary_words_are_not_fuzzy_matched():
+    resolver = make_resolver()
+    words = [
+        "Rest", "Trust", "Code", "Hash", "Cash", "Have", "Disco",
+        "String", "Clutter", "Scalar", "Rusty", "Javas"
+    ]
+    resolved, unresolved = resolver.resolve(words)
+    assert resolved == []
+    assert unresolved == words
+
+
+def test_tied_candidates_are_rejected():
+    # "Pands" is one dropped letter from both
+    assert make_resolver(["Pandas", "Pandos"]).resolve_token("Pands") is None
+    assert make_resolver(["Pandas"]).resolve_token("Pands") == "Pandas"
+    # Past the strict length, "Kubernetex" is one substitution from both
+    assert make_resolver(["Kubernetes", "Kubernetix"]).resolve_token("Kubernetex") is None
+
+
+def test_results_are_memoized():
+    resolver = make_resolver()
+    resolver.resolve(["pyhton", "Rest"])
+    assert resolver.cache == {"pyhton": "Python", "Rest": None}
+
+
+def test_resolve_batch_reports_unresolved_per_row():
+    resolver = make_resolver()
+    resolved, unresolved = resolver.resolve_batch([["Python", "foo"], ["k8s"], []])
+    assert resolved == [["Python"], ["Kubernetes"], []]
+    assert unresolved == [["foo"], [], []]
@@ -0,0 +1,81 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../scripts"))
+
+import generate_synthetic_dataset
+from dataset_loader import load_source
+from generate_synthetic_dataset import generate_dataset
+
+SOURCE_ROWS = [
+    # degree, specialization, cgpa, internship, projects, skills, job_role
+    ("B.Tech CS", "AI", 8.5, "Yes", 3, "Python, Machine Learning, SQL", "ML Engineer"),
+    ("B.Tech CS", "AI", 8.1, "Yes", 2, "Python, TensorFlow", "ML Engineer"),
+    ("M.Tech CS", "Data Science", 9.0, "Yes", 4, "Python, Machine Learning", "ML Engineer"),
+    ("MCA", "AI", 7.6, "No", 1, "Python, SQL", "ML Engineer"),
+    ("BCA", "Web Development", 7.2, "No", 2, "HTML, CSS, JavaScript", "Frontend Developer"),
+    ("BCA", "Web Development", 6.8, "No", 1, "HTML, CSS, React", "Frontend Developer"),
+    ("B.Sc", "Web Development", 7.9, "No", 3, "JavaScript, React", "Frontend Developer"),
+    ("B.Sc", "Networking", 7.0, "Yes", 2, "HTML, JavaScript", "Frontend Developer"),
+]
+
+
+@pytest.fixture
+def source_csv(tmp_path):
+    path = tmp_path / "source.csv"
+    pd.DataFrame(SOURCE_ROWS, columns=[
+        "degree", "specialization", "cgpa", "internship", "projects", "skills", "job_role"
+    ]).to_csv(path, index=False)
+    return str(path)
+
+
+def test_load_source_keeps_yes_no_internship(source_csv):
+    df = load_source(source_csv)
+    assert df["internship"].tolist() == [row[3] for row in SOURCE_ROWS]
+
+
+def test_load_source_reads_wide_schema(tmp_path):
+    path = tmp_path / "wide.csv"
+    path.write_text(
+        "degree,specialization,cgpa,yearOfGraduation,internship,projects,python,ml,web,job_role\n"
+        "MCA,CS,8.2,2024,1,2,1,1,0,ML Engineer\n"
+        "BCA,IT,7.1,2025,0,1,0,0,1,Web Developer\n"
+    )
+    df = load_source(str(path))
+    assert df["internship"].tolist() == ["Yes", "No"]
+    assert df["skills"].tolist() == [["python", "ml"], ["web"]]
+
+
+def test_output_does_not_depend_on_chunk_size(source_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_synthetic_dataset, "RNG_BLOCK_SIZE", 100)
+    small, large = tmp_path / "small.csv", tmp_path / "large.csv"
+
+    generate_dataset([source_csv], str(small), 1050, chunk_size=100, unseen_rate=0.1, seed=7)
+    generate_dataset([source_csv], str(large), 1050, chunk_size=1000, unseen_rate=0.1, seed=7)
+
+    assert small.read_bytes() == large.read_bytes()
+    assert len(pd.read_csv(small)) == 1050
+
+
+def test_seeded_run_matches_source_rates(source_csv, tmp_path):
+    out = tmp_path / "out.csv"
+    generate_dataset([source_csv], str(out), 20_000, unseen_rate=0.05, seed=3)
+    df = pd.read_csv(out)
+
+    internship_rate = (df["internship"] == "Yes").groupby(df["job_role"]).mean()
+    assert internship_rate["ML Engineer"] == pytest.approx(0.75, abs=0.03)
+    assert internship_rate["Frontend Developer"] == pytest.approx(0.25, abs=0.03)
+
+    assert df["degree"].str.startswith("Unseen Degree").mean() == pytest.approx(0.05, abs=0.01)
+    assert df["specialization"].str.startswith("Unseen Specialization").mean() == pytest.approx(0.05, abs=0.01)
+    assert df["skills"].str.contains("Unseen Skill").mean() == pytest.approx(0.05, abs=0.01)
+
+
+def test_mixed_schemas_are_rejected(source_csv, tmp_path):
+    wide = tmp_path / "wide.csv"
+    wide.write_text("degree,specialization,cgpa,internship,projects,python,job_role\nMCA,CS,8.2,1,2,1,ML Engineer\n")
+    with pytest.raises(ValueError):
+        generate_dataset([source_csv, str(wide)], str(tmp_path / "out.csv"), 10)